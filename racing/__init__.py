@@ -1,14 +1,37 @@
-"""Lightweight racing utilities for track layout and vehicle control."""
+"""Lightweight racing utilities for track layout and vehicle control.
 
-from .track import INDY_OVAL_TRACK, Track, Point, LineSegment, Checkpoint
+NumPy is required for track geometry and batched control, but is only imported
+once a :class:`Track` is built or the batch API is used. Numba is optional and
+only accelerates the physics kernels.
+"""
+
+from .track import Track, Point, LineSegment, Checkpoint, get_indy_oval_track
 from .car_controller import CarController, CarState
 
+# Resolved on first access: racing.batch_controller imports NumPy and Numba eagerly.
+_BATCH_EXPORTS = ("BatchCarController", "BatchCarState", "stack_states")
+
 __all__ = [
     "INDY_OVAL_TRACK",
+    "get_indy_oval_track",
     "Track",
     "Point",
     "LineSegment",
     "Checkpoint",
     "CarController",
     "CarState",
+    "BatchCarController",
+    "BatchCarState",
+    "stack_states",
 ]
+
+
+def __getattr__(name: str):
+    # Defer building the oval until first use; see racing.track.__getattr__.
+    if name == "INDY_OVAL_TRACK":
+        return get_indy_oval_track()
+    if name in _BATCH_EXPORTS:
+        from . import batch_controller
+
+        return getattr(batch_controller, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
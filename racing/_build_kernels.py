@@ -0,0 +1,54 @@
+"""Ahead-of-time compile the physics kernels into ``racing/_kernels_native``.
+
+Run ``python -m racing._build_kernels`` once per platform. The resulting
+extension has no Numba/LLVM runtime dependency and no first-call compile cost;
+the controllers pick it up automatically and fall back to the JIT kernels in
+:mod:`racing._kernels` when it is absent or was built for a different
+``KERNEL_ABI_VERSION``. The AOT build of ``simulate_batch`` is single
+threaded, so the parallel JIT version is still preferred whenever Numba is
+installed. Export signatures are derived from the kernels' own parameter
+lists, so adding a vehicle parameter only needs a ``KERNEL_ABI_VERSION`` bump.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+
+from numba.pycc import CC
+
+from . import _kernels
+from ._native import KERNEL_ABI_VERSION
+from ._params import VEHICLE_PARAMETERS
+
+# pack_params appends ``1 - min_high_speed_factor`` to the vehicle parameters.
+_NUM_PARAMS = len(VEHICLE_PARAMETERS) + 1
+
+cc = CC("_kernels_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _scalar_args(kernel, num_arrays: int = 0) -> str:
+    """Return ``f8`` for every argument of ``kernel`` after its leading arrays."""
+
+    names = list(inspect.signature(kernel.py_func).parameters)
+    if names[-_NUM_PARAMS] != "inv_wheelbase":
+        raise RuntimeError(f"{kernel.__name__} does not end with the {_NUM_PARAMS} packed vehicle parameters")
+    return ", ".join(["f8"] * (len(names) - num_arrays))
+
+
+def _kernel_abi_version() -> int:
+    return KERNEL_ABI_VERSION
+
+
+cc.export("kernel_abi_version", "i8()")(_kernel_abi_version)
+# step_kernel returns (x, y, heading, speed, cos, sin).
+cc.export("step_kernel", f"UniTuple(f8, 6)({_scalar_args(_kernels.step_kernel)})")(_kernels.step_kernel.py_func)
+cc.export(
+    "simulate_batch",
+    f"void(f8[:], f8[:], f8[:], f8[:], f8[:, :, :], {_scalar_args(_kernels.simulate_batch, num_arrays=5)})",
+)(_kernels.simulate_batch.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,289 @@
+"""Compiled physics kernels shared by the vehicle controllers."""
+
+from __future__ import annotations
+
+import functools
+import math
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange, set_num_threads
+    from numba.extending import register_jitable
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves kernels as plain Python functions."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    register_jitable = njit
+
+    def set_num_threads(n: int) -> None:
+        """Pure-Python kernels are single threaded; nothing to configure."""
+
+    def get_num_threads() -> int:
+        return 1
+
+
+@njit(cache=True, fastmath=True)
+def wrap_angle(angle: float) -> float:
+    """Wrap angle to (-pi, pi] for numerical stability."""
+
+    if -math.pi < angle <= math.pi:
+        return angle
+    # Constant-time reduction; lowers to a single rounding instruction.
+    return angle + 2 * math.pi * math.floor((math.pi - angle) * (0.5 / math.pi))
+
+
+def _define_step_kernel(ftype):
+    """Return the single-car step as a plain function computing in ``ftype``.
+
+    Every constant is converted to ``ftype`` here, so Numba types the whole
+    step in that precision instead of promoting ``float32`` state to
+    ``float64``. Double precision uses ``float`` so the function stays fast
+    when it runs interpreted.
+    """
+
+    zero = ftype(0.0)
+    one = ftype(1.0)
+    min_speed = ftype(1e-3)
+    pi = ftype(math.pi)
+    tau = ftype(math.tau)
+    inv_tau = ftype(0.5 / math.pi)
+
+    def step_kernel(
+        px: float,
+        py: float,
+        heading: float,
+        speed: float,
+        throttle: float,
+        steering: float,
+        dt: float,
+        trig_heading: float,
+        cos_heading: float,
+        sin_heading: float,
+        inv_wheelbase: float,
+        max_speed: float,
+        max_reverse_speed: float,
+        max_acceleration: float,
+        max_brake: float,
+        drag_coefficient: float,
+        rolling_resistance: float,
+        max_steering_angle: float,
+        min_high_speed_factor: float,
+        one_minus_min_factor: float,
+        steering_speed_sensitivity: float,
+    ):
+        """Advance a single car by ``dt`` seconds.
+
+        ``cos_heading``/``sin_heading`` are the cosine and sine of ``trig_heading``
+        and are reused whenever the new heading equals it, which skips the trig on
+        straight-line ticks. Returns ``(x, y, heading, speed, cos, sin)`` so the
+        caller can feed the trig of the returned heading into the next call.
+        """
+
+        # Clamps use conditional expressions: Numba lowers them to selects just
+        # like min/max, and they avoid builtin calls when running interpreted.
+        throttle = -one if throttle < -one else (one if throttle > one else throttle)
+        steering = -one if steering < -one else (one if steering > one else steering)
+
+        # Longitudinal dynamics
+        if throttle >= zero:
+            acceleration = throttle * max_acceleration
+        elif speed > zero:
+            # Smoothly brake when still moving forward.
+            acceleration = throttle * max_brake
+        else:
+            # Already stopped or reversing: allow throttle to build negative speed.
+            acceleration = throttle * max_acceleration
+        speed += acceleration * dt
+
+        # Apply drag and rolling resistance proportional to current speed. The
+        # resistance takes the sign of the speed and vanishes at rest; like the
+        # clamps, the conditional lowers to a select rather than a branch.
+        drag = drag_coefficient * speed * abs(speed)
+        resistance = math.copysign(rolling_resistance, speed) if speed != zero else zero
+        speed -= (drag + resistance) * dt
+
+        # Clamp forward/backward speeds separately.
+        speed = max_speed if speed > max_speed else (-max_reverse_speed if speed < -max_reverse_speed else speed)
+
+        # Avoid oscillating around zero with extremely small residual velocities.
+        speed = speed if abs(speed) >= min_speed else zero
+
+        # Lateral dynamics. No early exit: the yaw rate is exactly zero at rest or
+        # with centred steering, which keeps this path branch-free.
+        speed_factor = one / (one + abs(speed) * steering_speed_sensitivity)
+        factor = min_high_speed_factor + one_minus_min_factor * speed_factor
+        # Preserve steering authority even at high speed.
+        factor = min_high_speed_factor if factor < min_high_speed_factor else factor
+        steer_angle = steering * max_steering_angle * factor
+        yaw_rate = speed * math.tan(steer_angle) * inv_wheelbase
+        heading += yaw_rate * dt
+        if not -pi < heading <= pi:
+            # Same constant-time reduction as wrap_angle.
+            heading += tau * ftype(math.floor((pi - heading) * inv_tau))
+
+        # Keeping cos/sin of the same argument adjacent lets LLVM fuse them into
+        # a single sincos.
+        if heading != trig_heading:
+            cos_heading = math.cos(heading)
+            sin_heading = math.sin(heading)
+
+        # Integrate position using updated speed and heading
+        distance = speed * dt
+        px += cos_heading * distance
+        py += sin_heading * distance
+        return px, py, heading, speed, cos_heading, sin_heading
+
+    return step_kernel
+
+
+# Python functions rather than dispatchers, so that kernels capturing them in a
+# closure still hit Numba's on-disk cache.
+_step_f64 = register_jitable(fastmath=True)(_define_step_kernel(float))
+_step_f32 = register_jitable(fastmath=True)(_define_step_kernel(np.float32))
+
+step_kernel = njit(cache=True, fastmath=True)(_step_f64)
+
+
+# Each specialisation holds its own compiled code, so keep only the most
+# recently used ones rather than one per parameter set ever seen.
+_MAX_STEP_SPECIALISATIONS = 8
+
+
+@functools.lru_cache(maxsize=_MAX_STEP_SPECIALISATIONS)
+def make_step_kernel(dt: float, params: Tuple[float, ...]):
+    """Return :func:`step_kernel` specialised for a fixed ``dt`` and vehicle.
+
+    ``params`` is the tuple from :func:`racing._params.pack_params`. Numba
+    freezes closure variables as compile-time constants, so LLVM can fold the
+    products of ``dt`` with the vehicle constants. Specialisations are shared
+    between controllers with the same configuration, up to
+    ``_MAX_STEP_SPECIALISATIONS`` of them.
+    """
+
+    (
+        inv_wheelbase,
+        max_speed,
+        max_reverse_speed,
+        max_acceleration,
+        max_brake,
+        drag_coefficient,
+        rolling_resistance,
+        max_steering_angle,
+        min_high_speed_factor,
+        one_minus_min_factor,
+        steering_speed_sensitivity,
+    ) = params
+
+    @njit(fastmath=True)
+    def fixed_step_kernel(px, py, heading, speed, throttle, steering, trig_heading, cos_heading, sin_heading):
+        return step_kernel(
+            px,
+            py,
+            heading,
+            speed,
+            throttle,
+            steering,
+            dt,
+            trig_heading,
+            cos_heading,
+            sin_heading,
+            inv_wheelbase,
+            max_speed,
+            max_reverse_speed,
+            max_acceleration,
+            max_brake,
+            drag_coefficient,
+            rolling_resistance,
+            max_steering_angle,
+            min_high_speed_factor,
+            one_minus_min_factor,
+            steering_speed_sensitivity,
+        )
+
+    return fixed_step_kernel
+
+
+def _define_simulate_batch(step):
+    """Return the batch rollout over ``step``, a function from :func:`_define_step_kernel`."""
+
+    def simulate_batch(
+        pos_x,
+        pos_y,
+        heading,
+        speed,
+        actions,
+        dt: float,
+        inv_wheelbase: float,
+        max_speed: float,
+        max_reverse_speed: float,
+        max_acceleration: float,
+        max_brake: float,
+        drag_coefficient: float,
+        rolling_resistance: float,
+        max_steering_angle: float,
+        min_high_speed_factor: float,
+        one_minus_min_factor: float,
+        steering_speed_sensitivity: float,
+    ) -> None:
+        """Roll ``N`` cars forward through ``actions`` in place, one car per thread.
+
+        ``actions`` has shape ``(steps, N, 2)`` holding ``(throttle, steering)``
+        pairs. Each car's state stays in registers for the whole rollout, so this
+        is only worthwhile for batches; single cars should use :func:`step_kernel`.
+        State, actions, ``dt`` and the parameters must all share the precision
+        of ``step``.
+        """
+
+        steps = actions.shape[0]
+        for i in prange(pos_x.shape[0]):
+            px = pos_x[i]
+            py = pos_y[i]
+            h = heading[i]
+            s = speed[i]
+            c = math.cos(h)
+            sn = math.sin(h)
+            for t in range(steps):
+                px, py, h, s, c, sn = step(
+                    px,
+                    py,
+                    h,
+                    s,
+                    actions[t, i, 0],
+                    actions[t, i, 1],
+                    dt,
+                    h,
+                    c,
+                    sn,
+                    inv_wheelbase,
+                    max_speed,
+                    max_reverse_speed,
+                    max_acceleration,
+                    max_brake,
+                    drag_coefficient,
+                    rolling_resistance,
+                    max_steering_angle,
+                    min_high_speed_factor,
+                    one_minus_min_factor,
+                    steering_speed_sensitivity,
+                )
+            pos_x[i] = px
+            pos_y[i] = py
+            heading[i] = h
+            speed[i] = s
+
+    return simulate_batch
+
+
+simulate_batch = njit(parallel=True, cache=True, fastmath=True)(_define_simulate_batch(_step_f64))
+simulate_batch_f32 = njit(parallel=True, cache=True, fastmath=True)(_define_simulate_batch(_step_f32))
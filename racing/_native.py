@@ -0,0 +1,35 @@
+"""Loader for the ahead-of-time build of the physics kernels."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import warnings
+from types import ModuleType
+from typing import Optional
+
+# Bump whenever the signature of any kernel exported by racing._build_kernels
+# changes, so stale native builds are ignored instead of failing at call time.
+KERNEL_ABI_VERSION = 2
+
+
+@functools.cache
+def load_native_kernels() -> Optional[ModuleType]:
+    """Return ``racing._kernels_native`` if it was built for this kernel ABI, else ``None``."""
+
+    try:
+        native = importlib.import_module(f"{__package__}._kernels_native")
+    except ImportError:
+        return None
+
+    version = getattr(native, "kernel_abi_version", None)
+    built_for = version() if version is not None else None
+    if built_for != KERNEL_ABI_VERSION:
+        warnings.warn(
+            f"Ignoring stale racing._kernels_native (kernel ABI {built_for}, expected "
+            f"{KERNEL_ABI_VERSION}); rebuild it with 'python -m racing._build_kernels'",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return None
+    return native
@@ -0,0 +1,115 @@
+"""Vehicle parameters and their packed form passed to the physics kernels."""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+# Order of the public controller attributes consumed by pack_params.
+VEHICLE_PARAMETERS = (
+    "wheelbase",
+    "max_speed",
+    "max_reverse_speed",
+    "max_acceleration",
+    "max_brake",
+    "drag_coefficient",
+    "rolling_resistance",
+    "max_steering_angle",
+    "min_high_speed_factor",
+    "steering_speed_sensitivity",
+)
+
+
+def pack_params(
+    wheelbase: float,
+    max_speed: float,
+    max_reverse_speed: float,
+    max_acceleration: float,
+    max_brake: float,
+    drag_coefficient: float,
+    rolling_resistance: float,
+    max_steering_angle: float,
+    min_high_speed_factor: float,
+    steering_speed_sensitivity: float,
+) -> Tuple[float, ...]:
+    """Return the constant trailing arguments of the kernels, with divisions hoisted."""
+
+    # tan(steer_angle) must stay finite for the unconditional yaw-rate formula.
+    # The speed factor lies between min_high_speed_factor and 1, so this bounds
+    # every steering angle the kernels can produce.
+    if not abs(max_steering_angle) * max(1.0, abs(min_high_speed_factor)) < math.pi / 2:
+        raise ValueError(
+            "max_steering_angle * max(1, min_high_speed_factor) must be below pi/2 in magnitude, "
+            f"got {max_steering_angle} * max(1, {min_high_speed_factor})"
+        )
+    return (
+        1.0 / wheelbase,
+        max_speed,
+        max_reverse_speed,
+        max_acceleration,
+        max_brake,
+        drag_coefficient,
+        rolling_resistance,
+        max_steering_angle,
+        min_high_speed_factor,
+        1.0 - min_high_speed_factor,
+        steering_speed_sensitivity,
+    )
+
+
+class _VehicleParameter:
+    """Data descriptor that repacks the kernel arguments when a parameter is assigned."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: object, objtype: type = None) -> object:
+        if obj is None:
+            return self
+        return obj.__dict__[self._name]
+
+    def __set__(self, obj: "VehicleParameters", value: float) -> None:
+        values = obj.__dict__
+        if "_kernel_params" in values:
+            # Validate first so an invalid value leaves the controller unchanged.
+            updated = {name: values[name] for name in VEHICLE_PARAMETERS}
+            updated[self._name] = value
+            params = pack_params(**updated)
+            values[self._name] = value
+            obj._set_kernel_params(params)
+        else:
+            values[self._name] = value
+
+
+class VehicleParameters:
+    """Mixin that keeps the packed kernel arguments in sync with the vehicle attributes.
+
+    Subclasses assign every name in :data:`VEHICLE_PARAMETERS` and then call
+    :meth:`_pack_kernel_params`. Later assignments repack immediately, so a
+    changed limit applies from the next step; invalid values raise before the
+    attribute changes. Only these attributes are intercepted, so per-tick
+    state stores stay plain attribute writes.
+    """
+
+    wheelbase = _VehicleParameter()
+    max_speed = _VehicleParameter()
+    max_reverse_speed = _VehicleParameter()
+    max_acceleration = _VehicleParameter()
+    max_brake = _VehicleParameter()
+    drag_coefficient = _VehicleParameter()
+    rolling_resistance = _VehicleParameter()
+    max_steering_angle = _VehicleParameter()
+    min_high_speed_factor = _VehicleParameter()
+    steering_speed_sensitivity = _VehicleParameter()
+
+    @property
+    def kernel_params(self) -> Tuple[float, ...]:
+        """Packed trailing kernel arguments for the current vehicle parameters."""
+
+        return self._kernel_params
+
+    def _pack_kernel_params(self) -> None:
+        self._set_kernel_params(pack_params(*(getattr(self, param) for param in VEHICLE_PARAMETERS)))
+
+    def _set_kernel_params(self, params: Tuple[float, ...]) -> None:
+        self._kernel_params = params
@@ -0,0 +1,206 @@
+"""Vectorised controller that advances many cars per call using NumPy arrays."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from ._kernels import HAS_NUMBA, get_num_threads, set_num_threads, simulate_batch, simulate_batch_f32
+from ._native import load_native_kernels
+from ._params import VehicleParameters
+from .car_controller import CarState
+from .track import Point
+
+_simulate_batch_f64 = simulate_batch
+if not HAS_NUMBA and load_native_kernels() is not None:
+    # The AOT build is serial but still far faster than interpreted Python.
+    _simulate_batch_f64 = load_native_kernels().simulate_batch
+
+_SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+@dataclass
+class BatchCarState:
+    """Kinematic state of ``N`` cars stored as structure-of-arrays."""
+
+    pos_x: np.ndarray
+    pos_y: np.ndarray
+    heading: np.ndarray  # Radians, 0 along +X axis
+    speed: np.ndarray  # Signed speed in metres per second
+
+    @classmethod
+    def zeros(cls, num_cars: int, dtype: DTypeLike = np.float64) -> "BatchCarState":
+        return cls(*(np.zeros(num_cars, dtype=dtype) for _ in range(4)))
+
+    def __len__(self) -> int:
+        return len(self.speed)
+
+    def car(self, index: int) -> CarState:
+        """Return a scalar snapshot of a single car."""
+
+        return CarState(
+            position=Point(float(self.pos_x[index]), float(self.pos_y[index])),
+            heading=float(self.heading[index]),
+            speed=float(self.speed[index]),
+        )
+
+    def copy(self) -> "BatchCarState":
+        return BatchCarState(self.pos_x.copy(), self.pos_y.copy(), self.heading.copy(), self.speed.copy())
+
+    def astype(self, dtype: DTypeLike) -> "BatchCarState":
+        """Return a copy with every array converted to ``dtype``."""
+
+        return BatchCarState(*(array.astype(dtype) for array in (self.pos_x, self.pos_y, self.heading, self.speed)))
+
+
+def stack_states(states: Sequence[CarState], dtype: DTypeLike = np.float64) -> BatchCarState:
+    """Pack scalar car states into a :class:`BatchCarState`."""
+
+    return BatchCarState(
+        pos_x=np.array([state.position.x for state in states], dtype=dtype),
+        pos_y=np.array([state.position.y for state in states], dtype=dtype),
+        heading=np.array([state.heading for state in states], dtype=dtype),
+        speed=np.array([state.speed for state in states], dtype=dtype),
+    )
+
+
+class BatchCarController(VehicleParameters):
+    """Batched counterpart of :class:`CarController` with identical dynamics.
+
+    ``dtype=np.float32`` halves the memory traffic of large batches, and
+    :meth:`rollout` then also computes in single precision; metre-scale
+    positions and radian headings keep ample precision in float32.
+    """
+
+    def __init__(
+        self,
+        num_cars: int,
+        *,
+        wheelbase: float = 2.85,
+        max_speed: float = 90.0,
+        max_reverse_speed: float = 35.0,
+        max_acceleration: float = 8.0,
+        max_brake: float = 12.0,
+        drag_coefficient: float = 0.015,
+        rolling_resistance: float = 0.35,
+        max_steering_angle: float = math.radians(28.0),
+        min_high_speed_factor: float = 0.32,
+        steering_speed_sensitivity: float = 0.035,
+        dtype: DTypeLike = np.float64,
+    ) -> None:
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported state dtype {self.dtype}; use float32 or float64")
+        self.wheelbase = wheelbase
+        self.max_speed = max_speed
+        self.max_reverse_speed = max_reverse_speed
+        self.max_acceleration = max_acceleration
+        self.max_brake = max_brake
+        self.drag_coefficient = drag_coefficient
+        self.rolling_resistance = rolling_resistance
+        self.max_steering_angle = max_steering_angle
+        self.min_high_speed_factor = min_high_speed_factor
+        self.steering_speed_sensitivity = steering_speed_sensitivity
+        self.state = BatchCarState.zeros(num_cars, self.dtype)
+        self._pack_kernel_params()
+
+    @property
+    def num_cars(self) -> int:
+        return len(self.state)
+
+    def reset(self, state: Optional[BatchCarState] = None) -> None:
+        """Reset all cars to rest at the origin, or to a copy of ``state``."""
+
+        self.state = BatchCarState.zeros(self.num_cars, self.dtype) if state is None else state.astype(self.dtype)
+
+    def step(self, throttles: np.ndarray, steerings: np.ndarray, dt: float) -> BatchCarState:
+        """Advance every car by ``dt`` seconds, updating the state arrays in place.
+
+        ``throttles`` and ``steerings`` broadcast against ``(N,)``, so scalars
+        apply the same input to the whole batch.
+        """
+
+        (
+            inv_wheelbase,
+            max_speed,
+            max_reverse_speed,
+            max_acceleration,
+            max_brake,
+            drag_coefficient,
+            rolling_resistance,
+            max_steering_angle,
+            min_high_speed_factor,
+            one_minus_min_factor,
+            steering_speed_sensitivity,
+        ) = self._kernel_params
+        state = self.state
+        throttle = np.clip(np.asarray(throttles, dtype=self.dtype), -1.0, 1.0)
+        steering = np.clip(np.asarray(steerings, dtype=self.dtype), -1.0, 1.0)
+
+        # Longitudinal dynamics
+        max_acceleration = self.dtype.type(max_acceleration)
+        reverse_gain = np.where(state.speed > 0.0, self.dtype.type(max_brake), max_acceleration)
+        acceleration = throttle * np.where(throttle >= 0.0, max_acceleration, reverse_gain)
+        speed = state.speed + acceleration * dt
+
+        drag = drag_coefficient * speed * np.abs(speed)
+        resistance = rolling_resistance * np.sign(speed)
+        speed -= (drag + resistance) * dt
+        np.clip(speed, -max_reverse_speed, max_speed, out=speed)
+        speed *= np.abs(speed) >= 1e-3
+
+        # Lateral dynamics: yaw rate is naturally zero at rest or with centred steering.
+        speed_factor = 1.0 / (1.0 + np.abs(speed) * steering_speed_sensitivity)
+        factor = min_high_speed_factor + one_minus_min_factor * speed_factor
+        np.maximum(factor, min_high_speed_factor, out=factor)
+        steer_angle = steering * max_steering_angle * factor
+        yaw_rate = speed * np.tan(steer_angle) * inv_wheelbase
+        heading = state.heading + yaw_rate * dt
+
+        distance = speed * dt
+        state.pos_x += np.cos(heading) * distance
+        state.pos_y += np.sin(heading) * distance
+        # Wrap to (-pi, pi] with the same formula as wrap_angle, leaving in-range
+        # headings untouched so zero-yaw ticks do not accumulate rounding.
+        pi = self.dtype.type(math.pi)
+        wrapped = heading + self.dtype.type(math.tau) * np.floor((pi - heading) * self.dtype.type(0.5 / math.pi))
+        state.heading[:] = np.where((heading > -pi) & (heading <= pi), heading, wrapped)
+        state.speed[:] = speed
+        return state
+
+    def rollout(self, actions: np.ndarray, dt: float, *, num_threads: Optional[int] = None) -> BatchCarState:
+        """Apply ``actions`` of shape ``(steps, N, 2)`` using the multi-core kernel.
+
+        Each ``actions[t, i]`` is a ``(throttle, steering)`` pair. The whole
+        rollout runs without returning to Python, so prefer this over repeated
+        :meth:`step` calls when the action sequence is known up front.
+        ``num_threads`` limits the kernel's threads for this call only.
+        """
+
+        actions = np.ascontiguousarray(actions, dtype=self.dtype)
+        if actions.ndim != 3 or actions.shape[1:] != (self.num_cars, 2):
+            raise ValueError(f"Expected actions of shape (steps, {self.num_cars}, 2), got {actions.shape}")
+
+        if self.dtype == np.float64:
+            kernel, scalars = _simulate_batch_f64, (dt, *self._kernel_params)
+        else:
+            # Single-precision scalars keep the whole kernel in float32.
+            kernel, scalars = simulate_batch_f32, tuple(np.float32(value) for value in (dt, *self._kernel_params))
+        state = self.state
+        arrays = (state.pos_x, state.pos_y, state.heading, state.speed, actions)
+        if num_threads is None:
+            kernel(*arrays, *scalars)
+            return state
+
+        # Numba's thread count is per calling thread; restore it for later parallel work.
+        previous_threads = get_num_threads()
+        set_num_threads(num_threads)
+        try:
+            kernel(*arrays, *scalars)
+        finally:
+            set_num_threads(previous_threads)
+        return state
@@ -4,12 +4,36 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, replace
-from typing import Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
+from ._native import load_native_kernels
+from ._params import VehicleParameters
 from .track import Point
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+def _resolve_step_kernel(*args):
+    """Bind :data:`_step_kernel` on the first step, keeping Numba off ``import racing``."""
+
+    global _step_kernel
+    # Prefer the ahead-of-time build from racing._build_kernels: no JIT warm-up.
+    native = load_native_kernels()
+    if native is not None:
+        _step_kernel = native.step_kernel
+    else:
+        from . import _kernels
+
+        _step_kernel = _kernels.step_kernel
+    return _step_kernel(*args)
+
+
+# Rebound to the real kernel by its first call.
+_step_kernel = _resolve_step_kernel
+
+
+@dataclass(slots=True)
 class CarState:
     """Current kinematic state of the car."""
 
@@ -21,8 +45,18 @@ class CarState:
         return replace(self)
 
 
-class CarController:
-    """Simple car controller with stable steering behaviour at all speeds."""
+class CarController(VehicleParameters):
+    """Simple car controller with stable steering behaviour at all speeds.
+
+    Pass ``fixed_dt`` when the simulation always uses the same timestep and
+    vehicle; steps with that ``dt`` then run a kernel compiled with it and the
+    vehicle parameters baked in, saving a few tenths of a microsecond per
+    step. That kernel cannot be cached on disk, so the first such step (and
+    the first after any vehicle parameter or ``fixed_dt`` change) pays a JIT
+    compile of 0.1-0.5s: leave ``fixed_dt`` unset when parameters are
+    randomised per episode. It is skipped when the ahead-of-time build from
+    :mod:`racing._build_kernels` is available, which needs no warm-up.
+    """
 
     def __init__(
         self,
@@ -37,6 +71,7 @@ class CarController:
         max_steering_angle: float = math.radians(28.0),
         min_high_speed_factor: float = 0.32,
         steering_speed_sensitivity: float = 0.035,
+        fixed_dt: Optional[float] = None,
     ) -> None:
         self.wheelbase = wheelbase
         self.max_speed = max_speed
@@ -49,10 +84,41 @@ class CarController:
         self.min_high_speed_factor = min_high_speed_factor
         self.steering_speed_sensitivity = steering_speed_sensitivity
         self.state = CarState(position=Point(0.0, 0.0), heading=0.0, speed=0.0)
-
-    @staticmethod
-    def _clamp(value: float, minimum: float, maximum: float) -> float:
-        return max(minimum, min(maximum, value))
+        # (heading, cos, sin) of the last integrated heading, reused on straight-line ticks.
+        self._trig_cache = (0.0, 1.0, 0.0)
+        self._fixed_dt = fixed_dt
+        # Packed once here and again whenever a vehicle parameter is assigned,
+        # so each tick is a single kernel call.
+        self._pack_kernel_params()
+
+    @property
+    def fixed_dt(self) -> Optional[float]:
+        """Timestep of the specialised kernel, or ``None`` to always use the generic one."""
+
+        return self._fixed_dt
+
+    @fixed_dt.setter
+    def fixed_dt(self, value: Optional[float]) -> None:
+        self._fixed_dt = value
+        self._set_kernel_params(self._kernel_params)
+
+    def _set_kernel_params(self, params: Tuple[float, ...]) -> None:
+        super()._set_kernel_params(params)
+        # Compiled on the first fixed-dt tick rather than here, keeping construction cheap.
+        self._fixed_step_kernel = None
+        self._specialised_dt = self._fixed_dt
+
+    def _specialise_step_kernel(self):
+        # A fresh JIT compile would waste the warm-up-free native build.
+        if load_native_kernels() is None:
+            from ._kernels import HAS_NUMBA, make_step_kernel
+
+            # Without Numba a closure is no faster than the generic kernel.
+            if HAS_NUMBA:
+                self._fixed_step_kernel = make_step_kernel(self._fixed_dt, self._kernel_params)
+                return self._fixed_step_kernel
+        self._specialised_dt = None
+        return None
 
     def reset(self, *, position: Tuple[float, float] = (0.0, 0.0), heading: float = 0.0) -> None:
         """Reset the car state."""
@@ -62,78 +128,48 @@ class CarController:
     def step(self, throttle: float, steering: float, dt: float) -> CarState:
         """Advance the simulation by ``dt`` seconds."""
 
-        throttle = self._clamp(throttle, -1.0, 1.0)
-        steering = self._clamp(steering, -1.0, 1.0)
-
-        # Longitudinal dynamics
-        acceleration = self._longitudinal_acceleration(throttle)
-        speed = self._apply_longitudinal_physics(self.state.speed, acceleration, dt)
-
-        # Lateral dynamics
-        heading = self._apply_steering(self.state.heading, speed, steering, dt)
-
-        # Integrate position using updated speed and heading
-        dx = math.cos(heading) * speed * dt
-        dy = math.sin(heading) * speed * dt
-        position = Point(self.state.position.x + dx, self.state.position.y + dy)
-
-        self.state = CarState(position=position, heading=_wrap_angle(heading), speed=speed)
+        state = self.state
+        px, py, heading, speed = self._advance(
+            state.position.x, state.position.y, state.heading, state.speed, throttle, steering, dt
+        )
+        self.state = CarState(position=Point(px, py), heading=heading, speed=speed)
         return self.state
 
-    def _longitudinal_acceleration(self, throttle: float) -> float:
-        if throttle >= 0.0:
-            return throttle * self.max_acceleration
-
-        if self.state.speed > 0.0:
-            # Smoothly brake when still moving forward.
-            return throttle * self.max_brake
-
-        # Already stopped or reversing: allow throttle to build negative speed.
-        return throttle * self.max_acceleration
-
-    def _apply_longitudinal_physics(self, speed: float, acceleration: float, dt: float) -> float:
-        speed += acceleration * dt
-
-        # Apply drag and rolling resistance proportional to current speed.
-        drag = self.drag_coefficient * speed * abs(speed)
-        resistance = self.rolling_resistance * math.copysign(1.0, speed) if speed != 0 else 0.0
-        speed -= (drag + resistance) * dt
-
-        # Clamp forward/backward speeds separately.
-        if speed > 0.0:
-            speed = min(speed, self.max_speed)
+    def step_inplace(self, buf: np.ndarray, throttle: float, steering: float, dt: float) -> np.ndarray:
+        """Advance ``buf = [x, y, heading, speed]`` by ``dt`` seconds in place.
+
+        ``buf`` is a caller-owned float64 array that is overwritten with the new
+        state; ``self.state`` is left untouched, and no :class:`CarState` or
+        :class:`Point` is built. Use :class:`BatchCarController` to advance many
+        cars at once.
+        """
+
+        if buf.shape != (4,):
+            raise ValueError(f"Expected a state buffer of shape (4,), got {buf.shape}")
+        if buf.dtype != "float64":
+            raise ValueError(f"Expected a float64 state buffer, got {buf.dtype}")
+        px, py, heading, speed = buf.tolist()
+        buf[:] = self._advance(px, py, heading, speed, throttle, steering, dt)
+        return buf
+
+    def _advance(
+        self, px: float, py: float, heading: float, speed: float, throttle: float, steering: float, dt: float
+    ) -> Tuple[float, float, float, float]:
+        if dt == self._specialised_dt and (self._fixed_step_kernel or self._specialise_step_kernel()):
+            px, py, heading, speed, cos_heading, sin_heading = self._fixed_step_kernel(
+                px, py, heading, speed, throttle, steering, *self._trig_cache
+            )
         else:
-            speed = max(speed, -self.max_reverse_speed)
-
-        # Avoid oscillating around zero with extremely small residual velocities.
-        if abs(speed) < 1e-3:
-            speed = 0.0
-        return speed
-
-    def _apply_steering(self, heading: float, speed: float, steering: float, dt: float) -> float:
-        if speed == 0.0 or steering == 0.0:
-            return heading
-
-        steer_angle = self._steering_angle(speed, steering)
-        turning_radius = self.wheelbase / math.tan(steer_angle)
-        yaw_rate = speed / turning_radius
-        return heading + yaw_rate * dt
-
-    def _steering_angle(self, speed: float, steering: float) -> float:
-        abs_speed = abs(speed)
-        speed_factor = 1.0 / (1.0 + abs_speed * self.steering_speed_sensitivity)
-        factor = self.min_high_speed_factor + (1.0 - self.min_high_speed_factor) * speed_factor
-        # Preserve steering authority even at high speed.
-        factor = max(self.min_high_speed_factor, factor)
-        return steering * self.max_steering_angle * factor
-
-
-def _wrap_angle(angle: float) -> float:
-    """Wrap angle to [-pi, pi] for numerical stability."""
-
-    while angle <= -math.pi:
-        angle += 2 * math.pi
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    return angle
-
+            px, py, heading, speed, cos_heading, sin_heading = _step_kernel(
+                px,
+                py,
+                heading,
+                speed,
+                throttle,
+                steering,
+                dt,
+                *self._trig_cache,
+                *self._kernel_params,
+            )
+        self._trig_cache = (heading, cos_heading, sin_heading)
+        return px, py, heading, speed
@@ -0,0 +1,207 @@
+"""GPU rollout of large car batches using a Numba CUDA kernel.
+
+Requires Numba with a CUDA-capable device. Car states stay resident on the GPU
+between rollouts so only actions and requested observations cross PCIe.
+
+The device step is compiled from the same source as the CPU kernels, with
+every constant in the controller's dtype, so float32 batches stay off the slow
+FP64 units of consumer GPUs. It has only been exercised under the CUDA
+simulator (``NUMBA_ENABLE_CUDASIM=1``); compiling and running it on real
+hardware is untested.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from typing import Optional
+
+import numpy as np
+from numba import cuda
+
+from . import _kernels
+from .batch_controller import BatchCarController, BatchCarState
+
+# Host action batches in flight at once: one uploads while the other is read.
+_NUM_ACTION_SLOTS = 2
+
+
+@functools.cache
+def _rollout_kernel(dtype: np.dtype):
+    """Compile the rollout kernel for state, actions and parameters of ``dtype``."""
+
+    step = cuda.jit(device=True, fastmath=True)(_kernels._step_f32 if dtype == np.float32 else _kernels._step_f64)
+
+    @cuda.jit(fastmath=True)
+    def simulate_batch_cuda(
+        pos_x,
+        pos_y,
+        heading,
+        speed,
+        actions,
+        dt,
+        inv_wheelbase,
+        max_speed,
+        max_reverse_speed,
+        max_acceleration,
+        max_brake,
+        drag_coefficient,
+        rolling_resistance,
+        max_steering_angle,
+        min_high_speed_factor,
+        one_minus_min_factor,
+        steering_speed_sensitivity,
+    ):
+        # One thread per car; the state lives in registers for the whole rollout.
+        i = cuda.grid(1)
+        if i >= pos_x.shape[0]:
+            return
+
+        px = pos_x[i]
+        py = pos_y[i]
+        h = heading[i]
+        s = speed[i]
+        c = math.cos(h)
+        sn = math.sin(h)
+        for t in range(actions.shape[0]):
+            px, py, h, s, c, sn = step(
+                px,
+                py,
+                h,
+                s,
+                actions[t, i, 0],
+                actions[t, i, 1],
+                dt,
+                h,
+                c,
+                sn,
+                inv_wheelbase,
+                max_speed,
+                max_reverse_speed,
+                max_acceleration,
+                max_brake,
+                drag_coefficient,
+                rolling_resistance,
+                max_steering_angle,
+                min_high_speed_factor,
+                one_minus_min_factor,
+                steering_speed_sensitivity,
+            )
+        pos_x[i] = px
+        pos_y[i] = py
+        heading[i] = h
+        speed[i] = s
+
+    return simulate_batch_cuda
+
+
+class _ActionSlot:
+    """Pinned host buffer and its device copy, with events guarding their reuse."""
+
+    def __init__(self, shape: tuple, dtype: np.dtype) -> None:
+        self.host = cuda.pinned_array(shape, dtype=dtype)
+        self.device = cuda.device_array(shape, dtype=dtype)
+        self.uploaded = cuda.event()
+        self.consumed = cuda.event()
+
+
+class CudaBatchRollout:
+    """Device-resident copy of a :class:`BatchCarController` batch.
+
+    Vehicle parameters are read from ``controller`` at every rollout, so
+    assignments made after construction apply as they do on the CPU. Call
+    :meth:`upload` after resetting the controller to push its new state.
+    """
+
+    def __init__(
+        self,
+        controller: BatchCarController,
+        *,
+        threads_per_block: int = 256,
+        stream: Optional[cuda.cudadrv.driver.Stream] = None,
+    ) -> None:
+        self.controller = controller
+        self.dtype = controller.dtype
+        self.num_cars = controller.num_cars
+        self.threads_per_block = threads_per_block
+        self.stream = stream if stream is not None else cuda.stream()
+        # Host actions are copied on their own stream so that uploading the
+        # next batch overlaps with the kernel still running on ``stream``.
+        self._copy_stream = cuda.stream()
+        self._kernel = _rollout_kernel(self.dtype)
+        self._action_slots: list = []
+        self._next_slot = 0
+        self._device_state: Optional[tuple] = None
+        self.upload()
+
+    def upload(self, state: Optional[BatchCarState] = None) -> None:
+        """Replace the device state with ``state``, or with the controller's current state."""
+
+        state = self.controller.state if state is None else state
+        if len(state) != self.num_cars:
+            raise ValueError(f"Expected a state of {self.num_cars} cars, got {len(state)}")
+        arrays = [
+            np.ascontiguousarray(array, dtype=self.dtype)
+            for array in (state.pos_x, state.pos_y, state.heading, state.speed)
+        ]
+        if self._device_state is None:
+            self._device_state = tuple(cuda.to_device(array, stream=self.stream) for array in arrays)
+        else:
+            for device, array in zip(self._device_state, arrays):
+                device.copy_to_device(array, stream=self.stream)
+
+    def rollout(self, actions: np.ndarray, dt: float) -> None:
+        """Queue ``actions`` of shape ``(steps, N, 2)`` on the stream without blocking.
+
+        Device arrays (anything exposing ``__cuda_array_interface__``, including
+        CuPy arrays) are used as-is. Host arrays are staged through pinned
+        buffers and copied asynchronously; this call only waits if the buffer
+        it reuses is still being uploaded from two rollouts ago.
+        """
+
+        on_device = hasattr(actions, "__cuda_array_interface__")
+        if not on_device:
+            actions = np.asarray(actions)
+        if len(actions.shape) != 3 or tuple(actions.shape[1:]) != (self.num_cars, 2):
+            raise ValueError(f"Expected actions of shape (steps, {self.num_cars}, 2), got {actions.shape}")
+
+        slot = None
+        if not on_device:
+            slot = self._stage(actions)
+            actions = slot.device
+
+        ftype = self.dtype.type
+        scalars = (ftype(dt), *(ftype(value) for value in self.controller.kernel_params))
+        blocks = (self.num_cars + self.threads_per_block - 1) // self.threads_per_block
+        self._kernel[blocks, self.threads_per_block, self.stream](*self._device_state, actions, *scalars)
+        if slot is not None:
+            slot.consumed.record(self.stream)
+
+    def fetch(self) -> BatchCarState:
+        """Copy the current device state back to the host, waiting for queued work."""
+
+        host = [array.copy_to_host(stream=self.stream) for array in self._device_state]
+        self.stream.synchronize()
+        return BatchCarState(*host)
+
+    def _stage(self, actions: np.ndarray) -> _ActionSlot:
+        """Copy host ``actions`` into the next pinned slot and queue their upload."""
+
+        shape = tuple(actions.shape)
+        if not self._action_slots or self._action_slots[0].host.shape != shape:
+            # Buffers of the old shape may still be in use by queued work.
+            self._copy_stream.synchronize()
+            self.stream.synchronize()
+            self._action_slots = [_ActionSlot(shape, self.dtype) for _ in range(_NUM_ACTION_SLOTS)]
+
+        slot = self._action_slots[self._next_slot]
+        self._next_slot = (self._next_slot + 1) % _NUM_ACTION_SLOTS
+        # The pinned buffer is free once its previous upload finished; the
+        # device buffer is overwritten only after the kernel reading it is done.
+        slot.uploaded.synchronize()
+        slot.host[...] = actions
+        slot.consumed.wait(self._copy_stream)
+        slot.device.copy_to_device(slot.host, stream=self._copy_stream)
+        slot.uploaded.record(self._copy_stream)
+        slot.uploaded.wait(self.stream)
+        return slot
@@ -0,0 +1,113 @@
+import math
+import re
+
+import numpy as np
+import pytest
+
+from racing import _kernels
+from racing.batch_controller import BatchCarController, stack_states
+from racing.car_controller import CarController
+
+
+def test_batch_step_matches_scalar_controller():
+    throttles = np.array([1.0, -1.0, 0.4, -0.6, 0.0])
+    steerings = np.array([0.0, 0.7, -1.0, 0.3, 0.9])
+    controllers = [CarController() for _ in throttles]
+    for index, controller in enumerate(controllers):
+        controller.reset(position=(index * 3.0, -index), heading=0.5 * index)
+        controller.state.speed = 15.0 * (index - 2)
+
+    batch = BatchCarController(len(controllers))
+    batch.reset(stack_states([controller.state for controller in controllers]))
+    for _ in range(50):
+        batch.step(throttles, steerings, 0.1)
+        for controller, throttle, steering in zip(controllers, throttles, steerings):
+            controller.step(float(throttle), float(steering), 0.1)
+
+    for index, controller in enumerate(controllers):
+        car = batch.state.car(index)
+        assert math.isclose(car.position.x, controller.state.position.x, abs_tol=1e-6)
+        assert math.isclose(car.position.y, controller.state.position.y, abs_tol=1e-6)
+        assert math.isclose(car.heading, controller.state.heading, abs_tol=1e-9)
+        assert math.isclose(car.speed, controller.state.speed, abs_tol=1e-9)
+
+
+def test_batch_step_broadcasts_scalar_actions():
+    batch = BatchCarController(4)
+    state = batch.step(1.0, 0.0, 0.5)
+    assert np.all(state.speed > 0.0)
+    assert np.all(state.heading == 0.0)
+
+
+def test_rollout_matches_repeated_scalar_steps():
+    rng = np.random.default_rng(7)
+    actions = rng.uniform(-1.2, 1.2, size=(40, 6, 2))
+    batch = BatchCarController(6)
+    batch.rollout(actions, 0.05)
+
+    for index in range(6):
+        controller = CarController()
+        for throttle, steering in actions[:, index]:
+            controller.step(float(throttle), float(steering), 0.05)
+        car = batch.state.car(index)
+        assert math.isclose(car.position.x, controller.state.position.x, abs_tol=1e-6)
+        assert math.isclose(car.position.y, controller.state.position.y, abs_tol=1e-6)
+        assert math.isclose(car.speed, controller.state.speed, abs_tol=1e-9)
+
+
+def test_float32_batch_tracks_float64_batch():
+    rng = np.random.default_rng(3)
+    actions = rng.uniform(-1.0, 1.0, size=(60, 8, 2))
+    single = BatchCarController(8, dtype=np.float32)
+    double = BatchCarController(8)
+    for throttles, steerings in actions[:30].transpose(0, 2, 1):
+        single.step(throttles, steerings, 0.05)
+        double.step(throttles, steerings, 0.05)
+    single.rollout(actions[30:], 0.05)
+    double.rollout(actions[30:], 0.05)
+
+    for name in ("pos_x", "pos_y", "heading", "speed"):
+        assert getattr(single.state, name).dtype == np.float32
+        np.testing.assert_allclose(getattr(single.state, name), getattr(double.state, name), atol=1e-2)
+
+
+def test_float32_rollout_step_computes_in_single_precision():
+    numba = pytest.importorskip("numba")
+    step = numba.njit(_kernels._step_f32)
+    args = (0.0, 0.0, 3.0, 20.0, 0.5, 0.3, 0.05, 0.0, 1.0, 0.0, *BatchCarController(1).kernel_params)
+    step(*(np.float32(value) for value in args))
+
+    (signature,) = step.nopython_signatures
+    assert signature.return_type == numba.types.UniTuple(numba.float32, 6)
+    assert not re.search(r"\b(fadd|fsub|fmul|fdiv)\b[^\n]*\bdouble\b", step.inspect_llvm(signature.args))
+
+
+def test_rollout_restores_thread_count():
+    numba = pytest.importorskip("numba")
+    threads = numba.get_num_threads()
+    BatchCarController(4).rollout(np.zeros((3, 4, 2)), 0.1, num_threads=1)
+    assert numba.get_num_threads() == threads
+
+
+def test_step_and_rollout_share_assigned_limits():
+    stepped = BatchCarController(3)
+    rolled = BatchCarController(3)
+    stepped.max_speed = 5.0
+    rolled.max_speed = 5.0
+    for _ in range(50):
+        stepped.step(1.0, 0.0, 0.1)
+    rolled.rollout(np.tile([1.0, 0.0], (50, 3, 1)), 0.1)
+    np.testing.assert_array_equal(stepped.state.speed, 5.0)
+    np.testing.assert_array_equal(rolled.state.speed, 5.0)
+
+
+def test_batch_step_keeps_in_range_headings_exact():
+    batch = BatchCarController(3)
+    batch.state.heading[:] = [0.1, -3.0, 3.1]
+    batch.step(0.5, 0.0, 0.1)
+    assert batch.state.heading.tolist() == [0.1, -3.0, 3.1]
+
+    batch.state.heading[:] = [3 * math.pi, -3 * math.pi, 7.0]
+    batch.state.speed[:] = 0.0
+    batch.step(0.0, 0.0, 0.1)
+    np.testing.assert_allclose(batch.state.heading, [math.pi, math.pi, 7.0 - math.tau])
@@ -1,5 +1,15 @@
 import math
+import subprocess
+import sys
+import types
+import warnings
 
+import numpy as np
+import pytest
+
+from racing import _kernels
+from racing._kernels import wrap_angle
+from racing._native import load_native_kernels
 from racing.car_controller import CarController
 
 
@@ -26,3 +36,164 @@ def test_reverse_throttle_builds_negative_speed():
     controller.state.speed = 0.0
     controller.step(-1.0, 0.0, 0.5)
     assert controller.state.speed < 0.0
+
+
+def test_step_matches_baseline_formulas():
+    controller = CarController()
+
+    # Full throttle from rest: v = 8 * 0.5, then drag and rolling resistance.
+    state = controller.step(1.0, 0.0, 0.5)
+    speed = 4.0 - (0.015 * 4.0 * 4.0 + 0.35) * 0.5
+    assert speed == pytest.approx(3.705)
+    assert state.speed == pytest.approx(speed, rel=1e-12)
+    assert state.heading == 0.0
+    assert state.position.x == pytest.approx(speed * 0.5, rel=1e-12)
+    assert state.position.y == 0.0
+
+    # Coasting with half steering: turning radius wheelbase / tan(steer_angle).
+    x = state.position.x
+    state = controller.step(0.0, 0.5, 0.5)
+    speed -= (0.015 * speed * speed + 0.35) * 0.5
+    factor = 0.32 + 0.68 / (1.0 + speed * 0.035)
+    radius = 2.85 / math.tan(0.5 * math.radians(28.0) * factor)
+    heading = speed / radius * 0.5
+    assert state.speed == pytest.approx(speed, rel=1e-12)
+    assert state.heading == pytest.approx(heading, rel=1e-12)
+    assert state.position.x == pytest.approx(x + math.cos(heading) * speed * 0.5, rel=1e-12)
+    assert state.position.y == pytest.approx(math.sin(heading) * speed * 0.5, rel=1e-12)
+
+    # Braking while still moving forward uses max_brake rather than max_acceleration.
+    state = controller.step(-1.0, 0.0, 0.1)
+    speed -= 12.0 * 0.1
+    speed -= (0.015 * speed * speed + 0.35) * 0.1
+    assert state.speed == pytest.approx(speed, rel=1e-12)
+    assert state.heading == pytest.approx(heading, rel=1e-12)
+
+
+def test_straight_line_step_uses_externally_set_heading():
+    controller = CarController()
+    controller.step(1.0, 0.0, 0.5)
+    controller.state.heading = 1.0
+    before = controller.state.position
+    state = controller.step(1.0, 0.0, 0.5)
+    dx = state.position.x - before.x
+    dy = state.position.y - before.y
+    assert math.isclose(math.atan2(dy, dx), 1.0, abs_tol=1e-9)
+
+
+def test_wrap_angle_handles_large_angles():
+    assert wrap_angle(0.25) == 0.25
+    assert math.isclose(wrap_angle(3 * math.pi), math.pi)
+    assert math.isclose(wrap_angle(-3 * math.pi), math.pi)
+    assert math.isclose(wrap_angle(1e6), math.remainder(1e6, math.tau), abs_tol=1e-6)
+
+
+def test_state_copy_is_independent():
+    controller = CarController()
+    snapshot = controller.state.copy()
+    controller.step(1.0, 0.5, 0.5)
+    assert snapshot.speed == 0.0
+    assert not hasattr(snapshot, "__dict__")
+
+
+def test_native_kernel_matches_jit_kernel():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        native = load_native_kernels()
+    if native is None:
+        pytest.skip("no racing._kernels_native built for the current kernel ABI")
+    params = CarController().kernel_params
+    trig = (0.0, 1.0, 0.0)
+    for args in [(0.0, 0.0, 3.0, 12.0, 0.8, -0.6, 0.05, *trig), (5.0, -2.0, -3.1, -4.0, -1.0, 1.0, 0.5, *trig)]:
+        expected = _kernels.step_kernel(*args, *params)
+        for actual, reference in zip(native.step_kernel(*args, *params), expected):
+            assert math.isclose(actual, reference, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_step_inplace_matches_step():
+    controller = CarController()
+    reference = CarController()
+    buf = np.zeros(4)
+    for throttle, steering in [(1.0, 0.0), (0.6, 0.8), (-0.4, -0.3), (0.0, 0.0)]:
+        result = controller.step_inplace(buf, throttle, steering, 0.25)
+        state = reference.step(throttle, steering, 0.25)
+        assert result is buf
+        assert buf.tolist() == [state.position.x, state.position.y, state.heading, state.speed]
+    assert controller.state.speed == 0.0
+
+    with pytest.raises(ValueError):
+        controller.step_inplace(np.zeros((2, 4)), 1.0, 0.0, 0.25)
+    with pytest.raises(ValueError):
+        controller.step_inplace(np.zeros(4, dtype=np.float32), 1.0, 0.0, 0.25)
+
+
+def test_rejects_steering_angle_at_tan_singularity():
+    with pytest.raises(ValueError):
+        CarController(max_steering_angle=math.pi / 2)
+    with pytest.raises(ValueError):
+        CarController(max_steering_angle=-math.pi / 2)
+    # A high-speed factor above one scales the angle past the limit.
+    with pytest.raises(ValueError):
+        CarController(max_steering_angle=1.0, min_high_speed_factor=1.6)
+
+
+def test_accepts_negative_steering_angle():
+    # Mirrored steering was valid before the kernels existed and still is.
+    car = CarController(max_steering_angle=-math.radians(30))
+    car.step(1.0, 0.5, 0.1)
+    car.step(1.0, 0.5, 0.1)
+    assert car.state.heading < 0.0
+
+
+def test_fixed_dt_controller_matches_generic_step():
+    fixed = CarController(fixed_dt=1 / 60)
+    generic = CarController()
+    for tick in range(240):
+        throttle = 1.0 if tick < 120 else -0.5
+        steering = 0.0 if tick % 40 < 20 else 0.7
+        fixed.step(throttle, steering, 1 / 60)
+        generic.step(throttle, steering, 1 / 60)
+    assert math.isclose(fixed.state.position.x, generic.state.position.x, abs_tol=1e-6)
+    assert math.isclose(fixed.state.position.y, generic.state.position.y, abs_tol=1e-6)
+    assert math.isclose(fixed.state.heading, generic.state.heading, abs_tol=1e-9)
+    assert math.isclose(fixed.state.speed, generic.state.speed, abs_tol=1e-9)
+
+
+def test_fixed_dt_uses_native_kernel_without_compiling(monkeypatch):
+    def fail_to_compile(*args):
+        raise AssertionError("fixed-dt kernel compiled despite a native build")
+
+    native = types.SimpleNamespace(step_kernel=_kernels.step_kernel)
+    monkeypatch.setattr("racing.car_controller.load_native_kernels", lambda: native)
+    monkeypatch.setattr(_kernels, "make_step_kernel", fail_to_compile)
+    controller = CarController(fixed_dt=0.1)
+    reference = CarController()
+    for _ in range(3):
+        controller.step(1.0, 0.2, 0.1)
+        reference.step(1.0, 0.2, 0.1)
+    assert controller.state == reference.state
+
+
+def test_assigned_limits_apply_to_next_step():
+    controller = CarController()
+    controller.max_speed = 5.0
+    for _ in range(50):
+        controller.step(1.0, 0.0, 0.1)
+    assert controller.state.speed == 5.0
+
+    with pytest.raises(ValueError):
+        controller.max_steering_angle = math.pi
+    assert controller.max_steering_angle == math.radians(28.0)
+
+
+def test_assigned_limits_apply_to_fixed_dt_kernel():
+    controller = CarController(fixed_dt=0.1)
+    controller.max_speed = 5.0
+    for _ in range(50):
+        controller.step(1.0, 0.0, 0.1)
+    assert controller.state.speed == 5.0
+
+
+def test_import_racing_does_not_load_numba():
+    code = "import sys, racing; racing.CarController(); assert 'numba' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
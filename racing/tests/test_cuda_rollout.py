@@ -0,0 +1,58 @@
+"""CUDA rollout tests.
+
+Without a GPU these only run under the simulator (``NUMBA_ENABLE_CUDASIM=1``),
+which interprets the device step instead of compiling it for a device.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+cuda = pytest.importorskip("numba.cuda")
+
+if not cuda.is_available():
+    pytest.skip("CUDA device not available", allow_module_level=True)
+
+from racing.batch_controller import BatchCarController
+from racing.cuda_rollout import CudaBatchRollout
+
+
+def _assert_states_close(result, expected, atol):
+    for name in ("pos_x", "pos_y", "speed"):
+        np.testing.assert_allclose(getattr(result, name), getattr(expected, name), atol=atol)
+    # Headings near +/-pi may wrap to opposite ends on the two devices.
+    heading_error = np.remainder(result.heading - expected.heading + math.pi, math.tau) - math.pi
+    np.testing.assert_allclose(heading_error, 0.0, atol=atol)
+
+
+@pytest.mark.parametrize("dtype, atol", [(np.float64, 1e-6), (np.float32, 1e-2)])
+def test_cuda_rollout_matches_cpu_rollout(dtype, atol):
+    rng = np.random.default_rng(11)
+    actions = rng.uniform(-1.0, 1.0, size=(30, 300, 2))
+    cpu = BatchCarController(300, dtype=dtype)
+    gpu = CudaBatchRollout(BatchCarController(300, dtype=dtype))
+
+    # Three equal chunks, so the third reuses the first pinned staging slot.
+    for chunk in np.split(actions, 3):
+        cpu.rollout(chunk, 0.05)
+        gpu.rollout(chunk, 0.05)
+    result = gpu.fetch()
+
+    assert result.speed.dtype == dtype
+    _assert_states_close(result, cpu.state, atol)
+
+
+def test_cuda_rollout_follows_controller_parameters_and_uploads():
+    controller = BatchCarController(4)
+    gpu = CudaBatchRollout(controller)
+    controller.max_speed = 5.0
+    gpu.rollout(np.tile([1.0, 0.0], (50, 4, 1)), 0.1)
+    np.testing.assert_array_equal(gpu.fetch().speed, 5.0)
+
+    controller.reset()
+    controller.state.pos_x[:] = [1.0, 2.0, 3.0, 4.0]
+    gpu.upload()
+    result = gpu.fetch()
+    np.testing.assert_array_equal(result.pos_x, [1.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(result.speed, 0.0)
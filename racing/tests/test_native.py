@@ -0,0 +1,34 @@
+import sys
+import types
+
+import pytest
+
+from racing import _native
+
+
+@pytest.fixture
+def fresh_loader():
+    _native.load_native_kernels.cache_clear()
+    yield
+    _native.load_native_kernels.cache_clear()
+
+
+def test_stale_native_build_is_ignored(monkeypatch, fresh_loader):
+    stale = types.ModuleType("racing._kernels_native")
+    stale.kernel_abi_version = lambda: _native.KERNEL_ABI_VERSION - 1
+    monkeypatch.setitem(sys.modules, "racing._kernels_native", stale)
+    with pytest.warns(RuntimeWarning, match="stale"):
+        assert _native.load_native_kernels() is None
+
+
+def test_unversioned_native_build_is_ignored(monkeypatch, fresh_loader):
+    monkeypatch.setitem(sys.modules, "racing._kernels_native", types.ModuleType("racing._kernels_native"))
+    with pytest.warns(RuntimeWarning):
+        assert _native.load_native_kernels() is None
+
+
+def test_matching_native_build_is_used(monkeypatch, fresh_loader):
+    current = types.ModuleType("racing._kernels_native")
+    current.kernel_abi_version = lambda: _native.KERNEL_ABI_VERSION
+    monkeypatch.setitem(sys.modules, "racing._kernels_native", current)
+    assert _native.load_native_kernels() is current
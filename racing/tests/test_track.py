@@ -1,6 +1,13 @@
+import copy
 import math
+import pickle
+import subprocess
+import sys
+from dataclasses import asdict, replace
 
-from racing.track import INDY_OVAL_TRACK
+import pytest
+
+from racing.track import INDY_OVAL_TRACK, Checkpoint, LineSegment, Point, get_indy_oval_track
 
 
 def _dot(a, b):
@@ -23,3 +30,74 @@ def test_checkpoints_are_perpendicular_and_full_width():
         direction = checkpoint.segment.direction()
         assert math.isclose(_dot(tangent, direction), 0.0, abs_tol=0.12)
         assert checkpoint.segment.length() >= INDY_OVAL_TRACK.width
+
+
+def test_normals_are_unit_and_perpendicular_to_tangents():
+    normals = INDY_OVAL_TRACK.normals()
+    assert len(normals) == len(INDY_OVAL_TRACK.centerline)
+    for index, normal in enumerate(normals):
+        assert math.isclose(math.hypot(*normal), 1.0)
+        assert math.isclose(_dot(normal, INDY_OVAL_TRACK.tangent(index)), 0.0, abs_tol=1e-12)
+
+
+def test_centerline_array_matches_points():
+    xy = INDY_OVAL_TRACK.centerline_xy
+    assert xy.shape == (len(INDY_OVAL_TRACK.centerline), 2)
+    assert not xy.flags.writeable
+    for row, point in zip(xy.tolist(), INDY_OVAL_TRACK.centerline):
+        assert tuple(row) == point.as_tuple()
+
+
+def test_validate_geometry_reports_misaligned_checkpoint():
+    bad = Checkpoint(
+        "Skewed",
+        LineSegment(Point(-5.0, 40.0), Point(5.0, 50.0)),
+        10,
+    )
+    track = replace(INDY_OVAL_TRACK, checkpoints=(*INDY_OVAL_TRACK.checkpoints, bad))
+    with pytest.raises(ValueError, match="Checkpoint 'Skewed' is not perpendicular"):
+        track.validate_geometry()
+
+
+def test_indy_oval_is_built_once_on_demand():
+    import racing
+
+    # This module already touched the oval, so check laziness in a fresh interpreter.
+    code = (
+        "import sys, racing\n"
+        "from racing.track import get_indy_oval_track\n"
+        "assert get_indy_oval_track.cache_info().currsize == 0\n"
+        "assert 'numpy' not in sys.modules\n"
+        "track = racing.INDY_OVAL_TRACK\n"
+        "assert get_indy_oval_track.cache_info().currsize == 1\n"
+        "assert get_indy_oval_track() is track\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+    assert get_indy_oval_track() is INDY_OVAL_TRACK
+    assert racing.INDY_OVAL_TRACK is INDY_OVAL_TRACK
+
+
+def test_normals_array_matches_normals_list():
+    normals_xy = INDY_OVAL_TRACK.normals_xy
+    assert not normals_xy.flags.writeable
+    assert [tuple(row) for row in normals_xy.tolist()] == INDY_OVAL_TRACK.normals()
+
+
+@pytest.mark.parametrize("clone", [lambda t: pickle.loads(pickle.dumps(t)), copy.deepcopy])
+def test_copied_track_keeps_read_only_arrays(clone):
+    track = clone(INDY_OVAL_TRACK)
+    assert track == INDY_OVAL_TRACK
+    for array in (track.centerline_xy, track.normals_xy):
+        assert not array.flags.writeable
+    assert track.centerline_xy.tolist() == INDY_OVAL_TRACK.centerline_xy.tolist()
+
+
+def test_cached_geometry_is_not_a_dataclass_field():
+    segment = LineSegment(Point(0.0, 0.0), Point(3.0, 4.0))
+    assert asdict(segment) == {"start": {"x": 0.0, "y": 0.0}, "end": {"x": 3.0, "y": 4.0}}
+    assert "_xy" not in asdict(INDY_OVAL_TRACK)
+
+    clone = pickle.loads(pickle.dumps(segment))
+    assert clone == segment
+    assert clone.length() == 5.0
+    assert clone.direction() == (0.6, 0.8)
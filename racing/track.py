@@ -1,13 +1,17 @@
-"""Track layout primitives and a pre-built Indianapolis-inspired oval."""
+"""Track layout primitives and a lazily built Indianapolis-inspired oval."""
 
 from __future__ import annotations
 
+import functools
 import math
 from dataclasses import dataclass
-from typing import List, Sequence, Tuple
+from typing import TYPE_CHECKING, List, Sequence, Tuple
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Point:
     """2D coordinate."""
 
@@ -22,22 +26,33 @@ class Point:
 class LineSegment:
     """Straight line segment between two points."""
 
+    # Declared by hand so the cached geometry is slotted without becoming a
+    # dataclass field (and so leaking into ``asdict``/``astuple``).
+    __slots__ = ("start", "end", "_length", "_direction")
+
     start: Point
     end: Point
 
-    def direction(self) -> Tuple[float, float]:
+    def __post_init__(self) -> None:
         dx = self.end.x - self.start.x
         dy = self.end.y - self.start.y
         length = math.hypot(dx, dy)
-        if length == 0:
+        object.__setattr__(self, "_length", length)
+        object.__setattr__(self, "_direction", (dx / length, dy / length) if length != 0 else None)
+
+    def __reduce__(self):
+        return (type(self), (self.start, self.end))
+
+    def direction(self) -> Tuple[float, float]:
+        if self._direction is None:
             raise ValueError("Line segment has zero length")
-        return (dx / length, dy / length)
+        return self._direction
 
     def length(self) -> float:
-        return math.hypot(self.end.x - self.start.x, self.end.y - self.start.y)
+        return self._length
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Checkpoint:
     """Checkpoint that spans the track width at a specific centreline index."""
 
@@ -50,6 +65,19 @@ class Checkpoint:
 class Track:
     """Representation of a closed race track."""
 
+    # As for ``LineSegment``, the derived arrays are slots but not fields.
+    __slots__ = (
+        "name",
+        "centerline",
+        "width",
+        "goal_line",
+        "checkpoints",
+        "start_finish_index",
+        "_xy",
+        "_tangents",
+        "_normals",
+    )
+
     name: str
     centerline: Sequence[Point]
     width: float
@@ -57,28 +85,53 @@ class Track:
     checkpoints: Sequence[Checkpoint]
     start_finish_index: int
 
+    def __post_init__(self) -> None:
+        # Imported here so that ``import racing`` does not pay for NumPy.
+        import numpy as np
+
+        # The centreline is immutable, so derive its tangents and normals once
+        # from a contiguous (N, 2) copy of the coordinates.
+        xy = np.array([point.as_tuple() for point in self.centerline], dtype=np.float64).reshape(-1, 2)
+        delta = np.roll(xy, -1, axis=0) - np.roll(xy, 1, axis=0)
+        lengths = np.hypot(delta[:, 0], delta[:, 1])
+        if not lengths.all():
+            index = int(np.flatnonzero(lengths == 0)[0])
+            raise ValueError(f"Degenerate centreline segment around index {index}")
+        tangents = delta / lengths[:, None]
+        # Rotate tangents by 90 degrees clockwise to obtain outward normals.
+        normals = np.stack([tangents[:, 1], -tangents[:, 0]], axis=1)
+        for name, array in (("_xy", xy), ("_tangents", tangents), ("_normals", normals)):
+            array.setflags(write=False)
+            object.__setattr__(self, name, array)
+
+    def __reduce__(self):
+        # Pickle and deepcopy rebuild through the constructor: restoring the
+        # cached arrays directly would hand back writeable copies of them.
+        return (
+            type(self),
+            (self.name, self.centerline, self.width, self.goal_line, self.checkpoints, self.start_finish_index),
+        )
+
+    @property
+    def centerline_xy(self) -> np.ndarray:
+        """Read-only ``(N, 2)`` array of centreline coordinates."""
+
+        return self._xy
+
+    @property
+    def normals_xy(self) -> np.ndarray:
+        """Read-only ``(N, 2)`` array of outward unit normals along the centreline."""
+
+        return self._normals
+
     def _wrapped_index(self, index: int) -> int:
         return index % len(self.centerline)
 
-    def _centerline_vector(self, index: int) -> Tuple[float, float]:
-        prev_point = self.centerline[self._wrapped_index(index - 1)]
-        next_point = self.centerline[self._wrapped_index(index + 1)]
-        dx = next_point.x - prev_point.x
-        dy = next_point.y - prev_point.y
-        length = math.hypot(dx, dy)
-        if length == 0:
-            raise ValueError("Degenerate centreline segment around index {index}")
-        return (dx / length, dy / length)
-
     def tangent(self, index: int) -> Tuple[float, float]:
         """Return the unit tangent vector along the centreline."""
 
-        return self._centerline_vector(index)
-
-    def _segment_normal(self, index: int) -> Tuple[float, float]:
-        tangent = self._centerline_vector(index)
-        # Rotate tangent by 90 degrees clockwise to obtain an outward normal.
-        return (tangent[1], -tangent[0])
+        tx, ty = self._tangents[self._wrapped_index(index)].tolist()
+        return (tx, ty)
 
     def validate_geometry(
         self,
@@ -88,110 +141,139 @@ class Track:
     ) -> None:
         """Validate perpendicular goal line/checkpoints and spanning width."""
 
-        def _assert_perpendicular(tangent: Tuple[float, float], segment: LineSegment, label: str) -> None:
-            seg_dir = segment.direction()
-            dot = tangent[0] * seg_dir[0] + tangent[1] * seg_dir[1]
-            if abs(dot) > perpendicular_tolerance:
-                raise ValueError(f"{label} is not perpendicular to track tangent (dot={dot})")
-
-        # Goal line perpendicularity
-        start_tangent = self._centerline_vector(self.start_finish_index)
-        _assert_perpendicular(start_tangent, self.goal_line, "Goal line")
-
-        if self.goal_line.length() + length_tolerance < self.width:
-            raise ValueError("Goal line does not span the full track width")
+        import numpy as np
+
+        # Row 0 is the goal line, followed by each checkpoint in order.
+        segments = [self.goal_line, *(checkpoint.segment for checkpoint in self.checkpoints)]
+        indices = [self.start_finish_index, *(checkpoint.centerline_index for checkpoint in self.checkpoints)]
+        endpoints = np.array(
+            [(seg.start.x, seg.start.y, seg.end.x, seg.end.y) for seg in segments], dtype=np.float64
+        )
+        directions = endpoints[:, 2:] - endpoints[:, :2]
+        lengths = np.hypot(directions[:, 0], directions[:, 1])
+        if not lengths.all():
+            raise ValueError("Line segment has zero length")
 
-        for checkpoint in self.checkpoints:
-            tangent = self._centerline_vector(checkpoint.centerline_index)
-            _assert_perpendicular(tangent, checkpoint.segment, f"Checkpoint '{checkpoint.label}'")
-            if checkpoint.segment.length() + length_tolerance < self.width:
-                raise ValueError(f"Checkpoint '{checkpoint.label}' does not span the track width")
+        tangents = self._tangents[np.asarray(indices) % len(self._xy)]
+        dots = np.einsum("ij,ij->i", tangents, directions) / lengths
+        perpendicular = np.abs(dots) <= perpendicular_tolerance
+        spanning = lengths + length_tolerance >= self.width
+        if perpendicular.all() and spanning.all():
+            return
+
+        # Report the first failure in goal line, then checkpoint order.
+        labels = ["Goal line", *(f"Checkpoint '{checkpoint.label}'" for checkpoint in self.checkpoints)]
+        for row, label in enumerate(labels):
+            if not perpendicular[row]:
+                raise ValueError(f"{label} is not perpendicular to track tangent (dot={float(dots[row])})")
+            if not spanning[row]:
+                if row == 0:
+                    raise ValueError("Goal line does not span the full track width")
+                raise ValueError(f"{label} does not span the track width")
 
     def normals(self) -> List[Tuple[float, float]]:
-        """Return outward normals along the centreline for visualisation."""
+        """Return outward normals along the centreline for visualisation.
+
+        Prefer :attr:`normals_xy` for bulk work; it avoids building tuples.
+        """
 
-        return [self._segment_normal(i) for i in range(len(self.centerline))]
+        return [(nx, ny) for nx, ny in self._normals.tolist()]
 
 
 # Indianapolis-inspired oval track definition.
-_CENTERLINE: Tuple[Point, ...] = (
-    Point(70.0, -45.0),
-    Point(35.0, -45.0),
-    Point(0.0, -45.0),
-    Point(-35.0, -45.0),
-    Point(-70.0, -45.0),
-    Point(-75.0, -25.0),
-    Point(-75.0, 0.0),
-    Point(-75.0, 25.0),
-    Point(-70.0, 45.0),
-    Point(-35.0, 45.0),
-    Point(0.0, 45.0),
-    Point(35.0, 45.0),
-    Point(70.0, 45.0),
-    Point(75.0, 25.0),
-    Point(75.0, 0.0),
-    Point(75.0, -25.0),
+_CENTERLINE_XY: Tuple[Tuple[float, float], ...] = (
+    (70.0, -45.0),
+    (35.0, -45.0),
+    (0.0, -45.0),
+    (-35.0, -45.0),
+    (-70.0, -45.0),
+    (-75.0, -25.0),
+    (-75.0, 0.0),
+    (-75.0, 25.0),
+    (-70.0, 45.0),
+    (-35.0, 45.0),
+    (0.0, 45.0),
+    (35.0, 45.0),
+    (70.0, 45.0),
+    (75.0, 25.0),
+    (75.0, 0.0),
+    (75.0, -25.0),
 )
 
+_CENTERLINE: Tuple[Point, ...] = tuple(Point(x, y) for x, y in _CENTERLINE_XY)
+
 _TRACK_WIDTH = 18.0
+_HALF_WIDTH = _TRACK_WIDTH / 2
 
 _INDYCAR_GOAL_LINE = LineSegment(
-    Point(0.0, -45.0 - _TRACK_WIDTH / 2),
-    Point(0.0, -45.0 + _TRACK_WIDTH / 2),
+    Point(0.0, -45.0 - _HALF_WIDTH),
+    Point(0.0, -45.0 + _HALF_WIDTH),
 )
 
 _CHECKPOINTS: Tuple[Checkpoint, ...] = (
     Checkpoint(
         "Turn 1",
         LineSegment(
-            Point(-75.0 - _TRACK_WIDTH / 2, -25.0),
-            Point(-75.0 + _TRACK_WIDTH / 2, -25.0),
+            Point(-75.0 - _HALF_WIDTH, -25.0),
+            Point(-75.0 + _HALF_WIDTH, -25.0),
         ),
         5,
     ),
     Checkpoint(
         "North Short Chute",
         LineSegment(
-            Point(-75.0 - _TRACK_WIDTH / 2, 0.0),
-            Point(-75.0 + _TRACK_WIDTH / 2, 0.0),
+            Point(-75.0 - _HALF_WIDTH, 0.0),
+            Point(-75.0 + _HALF_WIDTH, 0.0),
         ),
         6,
     ),
     Checkpoint(
         "Backstretch",
         LineSegment(
-            Point(0.0, 45.0 - _TRACK_WIDTH / 2),
-            Point(0.0, 45.0 + _TRACK_WIDTH / 2),
+            Point(0.0, 45.0 - _HALF_WIDTH),
+            Point(0.0, 45.0 + _HALF_WIDTH),
         ),
         10,
     ),
     Checkpoint(
         "Turn 3",
         LineSegment(
-            Point(75.0 - _TRACK_WIDTH / 2, 25.0),
-            Point(75.0 + _TRACK_WIDTH / 2, 25.0),
+            Point(75.0 - _HALF_WIDTH, 25.0),
+            Point(75.0 + _HALF_WIDTH, 25.0),
         ),
         13,
     ),
     Checkpoint(
         "South Short Chute",
         LineSegment(
-            Point(75.0 - _TRACK_WIDTH / 2, 0.0),
-            Point(75.0 + _TRACK_WIDTH / 2, 0.0),
+            Point(75.0 - _HALF_WIDTH, 0.0),
+            Point(75.0 + _HALF_WIDTH, 0.0),
         ),
         14,
     ),
 )
 
-INDY_OVAL_TRACK = Track(
-    name="Indy Oval",
-    centerline=_CENTERLINE,
-    width=_TRACK_WIDTH,
-    goal_line=_INDYCAR_GOAL_LINE,
-    checkpoints=_CHECKPOINTS,
-    start_finish_index=2,
-)
-
-# Validate geometry eagerly so incorrect edits are caught during import.
-INDY_OVAL_TRACK.validate_geometry()
 
+@functools.cache
+def get_indy_oval_track() -> Track:
+    """Return the Indy oval, building and validating it on first use."""
+
+    track = Track(
+        name="Indy Oval",
+        centerline=_CENTERLINE,
+        width=_TRACK_WIDTH,
+        goal_line=_INDYCAR_GOAL_LINE,
+        checkpoints=_CHECKPOINTS,
+        start_finish_index=2,
+    )
+    # Validate geometry eagerly so incorrect edits are caught on first access.
+    track.validate_geometry()
+    return track
+
+
+def __getattr__(name: str):
+    # ``INDY_OVAL_TRACK`` is resolved lazily (PEP 562) so importing the module
+    # stays cheap for processes that never touch the track.
+    if name == "INDY_OVAL_TRACK":
+        return get_indy_oval_track()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")